@@ -1,16 +1,205 @@
 #!/usr/bin/env python3
+import asyncio
+import json
+import logging
+import logging.handlers
 import os
+import queue
 import time
-import re
 import random
+from textwrap import dedent
 from urllib.parse import urlparse
-from playwright.sync_api import sync_playwright, Error as PlaywrightError
+from playwright.async_api import (
+    async_playwright,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 
 # --- Global Trade Setting ---
 TRADE_ASSET = "ETH"  # Change to "SOL" or "ETH" depending on which asset you want to trade.
 COOKIE_FILE = "cookies.txt"
 PROXY_FILE = "proxy.txt"
+PROFILE_DIR = ".arkham_profile"
+
+# Requests matching these are aborted; the bot only needs the trade form
+# and its data feeds (see block_nonessential_requests).
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+BLOCKED_URL_FRAGMENTS = ("googletagmanager", "segment", "sentry", "doubleclick")
 ORDER_SELECTOR = '[data-testid="trade-tradeinfo-order-id-0"]'
+WALLET_READY_SELECTOR = '[data-testid="trade-wallet-asset-name-0"]'
+BUY_PRICE_SELECTOR = "div.text-green-900 button, button.text-green-900"
+SELL_PRICE_SELECTOR = "div.text-red-900 button, button.text-red-900"
+
+# Selectors the trade loop hits constantly; their Locator objects are built
+# once per page (see build_locators) so Playwright parses each string once.
+HOT_SELECTORS = {
+    "buy_tab": '[data-testid="trade-orderform-buy-tab"]',
+    "sell_tab": '[data-testid="trade-orderform-sell-tab"]',
+    "limit_tab": '[data-testid="trade-orderform-limit-tab"]',
+    "limit_price_input": '[data-testid="trade-orderform-limit-price-input"]',
+    "notional_input": '[data-testid="trade-orderform-notional-input"]',
+    "size_input": '[data-testid="trade-orderform-size-input"]',
+    "submit_button": '[data-testid="trade-orderform-submit-button"]',
+    "order": ORDER_SELECTOR,
+}
+LOCATORS = {}
+
+def build_locators(page):
+    """Build the cached Locator objects for the current page."""
+    global LOCATORS
+    LOCATORS = {name: page.locator(sel) for name, sel in HOT_SELECTORS.items()}
+
+# Latest prices pushed from the page via the onPrice binding, keyed by
+# "buy"/"sell". Reading this dict replaces a DOM round-trip in the hot loop.
+LATEST_PRICES = {}
+
+def record_price(source, side, text):
+    """Binding callback: store the newest price text pushed by the page."""
+    LATEST_PRICES[side] = (text or "").strip()
+
+# Installed on every page; a MutationObserver on each price button calls
+# window.onPrice(side, text) whenever the displayed price changes. A
+# second, body-level observer re-attaches the per-button observers when
+# the SPA replaces the button nodes outright — a detached node's own
+# observer never fires again, so replacement is invisible to it. The
+# latest values are also mirrored on window.__lastPrices so in-page
+# scripts can read them without resolving a selector.
+PRICE_FEED_JS = """
+    (() => {
+        window.__lastPrices = window.__lastPrices || {};
+        const targets = { buy: '%s', sell: '%s' };
+        const watched = {};
+        const observers = {};
+        const push = (side, el) => {
+            const text = (el.textContent || '').trim();
+            window.__lastPrices[side] = text;
+            window.onPrice(side, text);
+        };
+        const attach = () => {
+            for (const [side, sel] of Object.entries(targets)) {
+                const el = document.querySelector(sel);
+                if (!el || el === watched[side]) continue;
+                if (observers[side]) observers[side].disconnect();
+                watched[side] = el;
+                observers[side] = new MutationObserver(() => push(side, el));
+                observers[side].observe(el, { characterData: true, childList: true, subtree: true });
+                push(side, el);
+            }
+        };
+        const arm = () => {
+            new MutationObserver(attach).observe(document.body, { childList: true, subtree: true });
+            attach();
+        };
+        if (document.body) arm();
+        else document.addEventListener('DOMContentLoaded', arm);
+    })();
+""" % (BUY_PRICE_SELECTOR, SELL_PRICE_SELECTOR)
+
+# Anti-detect shims; dedented once at import time so each new context
+# receives the same compact script instead of re-building it inline.
+STEALTH_INIT_JS = dedent("""\
+    Object.defineProperty(navigator, 'webdriver', { get: () => false });
+    Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
+    Object.defineProperty(navigator, 'appVersion', { get: () => '5.0 (Windows NT 10.0; Win64; x64)' });
+    window.chrome = { runtime: {} };
+    Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
+    Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
+    sessionStorage.setItem('metamaskConfig', JSON.stringify({
+        hideProvidersArray: false,
+        showMetamaskExplainer: false,
+        dontOverrideWindowEthereum: false
+    }));
+""")
+
+# Seeds the WalletConnect IndexedDB store. Guarded via sessionStorage so
+# the database work runs once per session, not on every navigation.
+WALLET_DB_INIT_JS = dedent("""\
+    (() => {
+        if (sessionStorage.getItem('__arkm_db_init')) return;
+        sessionStorage.setItem('__arkm_db_init', '1');
+        const dbName = "WALLET_CONNECT_V2_INDEXED_DB";
+        const storeName = "keyvaluepairs";
+        const key = "wc@2:core:0.3:keychain";
+        const value = JSON.stringify({});
+        const openRequest = indexedDB.open(dbName);
+        openRequest.onupgradeneeded = (e) => {
+            const db = e.target.result;
+            if (!db.objectStoreNames.contains(storeName)) {
+                db.createObjectStore(storeName);
+            }
+        };
+        openRequest.onerror = (e) => { console.error(e.target.error); };
+        openRequest.onsuccess = (e) => {
+            const db = e.target.result;
+            const tx = db.transaction(storeName, "readwrite");
+            const store = tx.objectStore(storeName);
+            store.put(value, key);
+            tx.oncomplete = () => { db.close(); };
+        };
+    })();
+""")
+
+# Evaluate sources used on the hot path, hoisted so every call ships the
+# same source string; V8's script cache keys on source identity, so stable
+# sources are compiled once per page instead of on every invocation.
+# Selectors travel as arguments, never interpolated into the source.
+BALANCES_JS = """
+    (timeoutMs) => new Promise((resolve, reject) => {
+        const q = s => document.querySelector(s)?.textContent?.trim() ?? '';
+        const deadline = performance.now() + timeoutMs;
+        const read = () => {
+            const snap = {
+                n0: q('[data-testid="trade-wallet-asset-name-0"]'),
+                n1: q('[data-testid="trade-wallet-asset-name-1"]'),
+                f0: q('[data-testid="trade-wallet-asset-free-0"]'),
+                f1: q('[data-testid="trade-wallet-asset-free-1"]'),
+            };
+            if (snap.n0 && snap.n1 && snap.f0 && snap.f1) return resolve(snap);
+            if (performance.now() > deadline) return reject(new Error('wallet assets not found'));
+            requestAnimationFrame(read);
+        };
+        read();
+    })
+"""
+
+TAB_ACTIVATE_JS = """
+    sel => {
+        const el = document.querySelector(sel);
+        if (el && el.getAttribute('aria-selected') !== 'true') el.click();
+    }
+"""
+
+RAF_YIELD_JS = "new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+ORDER_PRESENT_JS = "sel => !!document.querySelector(sel)"
+
+LAST_PRICE_JS = "side => window.__lastPrices?.[side]"
+
+FILL_ORDER_FORM_JS = """
+    ([priceSel, priceVal, amountSel, amountVal, liveSel, side]) => {
+        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+        const setInput = (sel, val) => {
+            const el = document.querySelector(sel);
+            if (!el) return;
+            setter.call(el, val);
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+        };
+        const used = (side && window.__lastPrices?.[side]) || priceVal;
+        setInput(priceSel, used);
+        setInput(amountSel, amountVal);
+        return [used, document.querySelector(liveSel)?.textContent?.trim() ?? ''];
+    }
+"""
+
+ORDER_OR_PRICE_CHANGE_JS = """
+    ([orderSel, priceSel, pinned, side]) => {
+        const order = document.querySelector(orderSel);
+        if (!order) return true;
+        const price = (side && window.__lastPrices?.[side])
+            || document.querySelector(priceSel)?.textContent?.trim();
+        return !!(price && pinned && price !== pinned);
+    }
+"""
 
 # Global speed multiplier (1.0 = normal; 0.5 = 50% faster)
 SPEED_FACTOR = 0.5
@@ -19,40 +208,56 @@ SPEED_FACTOR = 0.5
 CANCEL_FAILURE_THRESHOLD = 3
 cancellation_failures = 0
 
-def random_delay(min_delay=0.5, max_delay=2):
+# Deletion table for parse_balance: drops every character that is not a
+# digit or a dot in one C-level pass, with no regex machinery at all.
+_BAL_KEEP = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if chr(c) not in '0123456789.'))
+
+# Diagnostics go through a queue to a background thread, so a slow or
+# backpressured stdout never stalls the trade-decision path.
+log = logging.getLogger("arkham")
+
+def setup_logging():
+    """Wire the arkham logger to stdout via a QueueListener thread."""
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    return listener
+
+async def random_delay(min_delay=0.05, max_delay=0.25):
     # Adjust delays by SPEED_FACTOR while still being random
-    time.sleep(random.uniform(min_delay * SPEED_FACTOR, max_delay * SPEED_FACTOR))
+    await asyncio.sleep(random.uniform(min_delay * SPEED_FACTOR, max_delay * SPEED_FACTOR))
 
 def parse_balance(balance_str):
     """Remove non-digit characters and convert to float."""
-    clean_str = re.sub(r'[^\d\.]', '', balance_str)
     try:
-        return float(clean_str)
+        return float(balance_str.translate(_BAL_KEEP) or 0)
     except Exception as e:
-        print("Error parsing balance:", e)
+        log.info("Error parsing balance: %s", e)
         return 0.0
 
-def get_balances(page):
+# Balances only change when an order fills; cache the last read and drop it
+# on the fill paths so retried attempts skip the six-node wallet read.
+_balances_cache = {"val": None}
+
+async def get_balances(page):
     """
     Reads wallet balances from the page.
+    All four DOM nodes are read in a single page.evaluate (one round-trip
+    instead of four); the waiting is done in-page with requestAnimationFrame.
     Returns (asset_balance, usdt_balance) based on TRADE_ASSET.
     """
-    asset0_name_sel = '[data-testid="trade-wallet-asset-name-0"]'
-    asset1_name_sel = '[data-testid="trade-wallet-asset-name-1"]'
-    asset0_free_sel = '[data-testid="trade-wallet-asset-free-0"]'
-    asset1_free_sel = '[data-testid="trade-wallet-asset-free-1"]'
-
-    page.wait_for_selector(asset0_name_sel)
-    page.wait_for_selector(asset1_name_sel)
-
-    asset0_name = (page.text_content(asset0_name_sel) or '').strip()
-    asset1_name = (page.text_content(asset1_name_sel) or '').strip()
+    data = await page.evaluate(BALANCES_JS, 30000)
 
-    asset0_balance_str = (page.text_content(asset0_free_sel) or '').strip()
-    asset1_balance_str = (page.text_content(asset1_free_sel) or '').strip()
+    asset0_name = data["n0"]
+    asset1_name = data["n1"]
 
-    asset0_balance = parse_balance(asset0_balance_str)
-    asset1_balance = parse_balance(asset1_balance_str)
+    asset0_balance = parse_balance(data["f0"])
+    asset1_balance = parse_balance(data["f1"])
 
     # Determine which balance corresponds to TRADE_ASSET
     if TRADE_ASSET.upper() in asset0_name.upper():
@@ -63,32 +268,49 @@ def get_balances(page):
         usdt_balance = asset0_balance - 1  # Adjust USDT balance as in original logic
     return asset_balance, usdt_balance
 
-def move_mouse_to_element(page, selector):
-    """Smoothly move the mouse to the center of the element with fewer steps."""
-    element_handle = page.wait_for_selector(selector)
-    box = element_handle.bounding_box()
+async def get_balances_cached(page):
+    """Return the cached balances, reading from the page only when stale."""
+    if _balances_cache["val"] is None:
+        _balances_cache["val"] = await get_balances(page)
+    return _balances_cache["val"]
+
+async def move_mouse_to_element(page, locator):
+    """Smoothly move the mouse to the center of the element in one round-trip."""
+    # Make sure the target is actually on screen before measuring it.
+    await locator.scroll_into_view_if_needed(timeout=5000)
+    box = await locator.bounding_box(timeout=5000)
     if not box:
-        print(f"Could not get bounding box for {selector}")
+        log.info("Could not get bounding box for %s", locator)
         return
-    target_x = box["x"] + box["width"] / 2
-    target_y = box["y"] + box["height"] / 2
-    steps = 10  # Reduced steps from 20 to 10
-    for i in range(1, steps + 1):
-        # Add slight randomness to each step to mimic human movement
-        intermediate_x = target_x * (i / steps) + random.uniform(-1, 1)
-        intermediate_y = target_y * (i / steps) + random.uniform(-1, 1)
-        page.mouse.move(intermediate_x, intermediate_y)
-        random_delay(0.01, 0.03)  # Shorter delay per step
-
-def click_element(page, selector):
+    # A single randomized end-point jitter keeps the movement non-robotic;
+    # the steps= interpolation happens browser-side in one CDP call.
+    # random.random() skips the bound-method and range arithmetic that
+    # uniform() re-does on every call.
+    target_x = box["x"] + box["width"] / 2 + (random.random() * 2 - 1)
+    target_y = box["y"] + box["height"] / 2 + (random.random() * 2 - 1)
+    await page.mouse.move(target_x, target_y, steps=8)
+
+async def click_element(page, locator):
     """Move to an element, wait a bit, then click it."""
-    page.wait_for_selector(selector, timeout=5000)
-    move_mouse_to_element(page, selector)
-    random_delay(0.5, 1.5)
-    page.click(selector)
-    random_delay(0.5, 1.5)
+    # bounding_box and click both auto-wait on the element, so a separate
+    # wait_for here would just be one more round-trip.
+    await move_mouse_to_element(page, locator)
+    await random_delay()
+    await locator.click(timeout=5000)
+
+async def ensure_tab(page, tab_name):
+    """
+    Activate an order-form tab if it is not already active. The check and
+    the click share one evaluate: tab switches are pure UI state, so they
+    do not need the simulated mouse a full click_element pays for.
+    """
+    try:
+        await page.evaluate(TAB_ACTIVATE_JS, HOT_SELECTORS[tab_name])
+    except Exception as e:
+        log.info("Error activating tab %s: %s", tab_name, e)
+        await click_element(page, LOCATORS[tab_name])
 
-def cancel_order(page):
+async def cancel_order(page):
     """
     Attempt to cancel the active order.
     First try clicking normally; if that fails, force a click via JS.
@@ -97,433 +319,566 @@ def cancel_order(page):
     """
     global cancellation_failures
     cancel_button_selector = '.a480080.a99729a.ac07bd5.af77d85'
+    cancel_locator = page.locator(cancel_button_selector).first
 
     try:
-        cancel_locator = page.locator(cancel_button_selector).first
-        cancel_locator.wait_for(state="visible", timeout=5000)
-        cancel_locator.click()
-        random_delay()
-        print("Order cancelled normally.")
+        # click auto-waits for visibility; bound it instead of pre-waiting.
+        await cancel_locator.click(timeout=5000)
+        await random_delay()
+        log.info("Order cancelled normally.")
         cancellation_failures = 0  # Reset on success
     except Exception as e:
-        print("Error cancelling order normally:", e)
+        log.info("Error cancelling order normally: %s", e)
         cancellation_failures += 1
         try:
-            print("Attempting force cancellation...")
-            page.evaluate(f"document.querySelector('{cancel_button_selector}').click()")
-            random_delay()
-            print("Order cancelled using force.")
+            log.info("Attempting force cancellation...")
+            # dispatch_event skips actionability checks (the reason the
+            # normal click failed) without compiling a fresh JS snippet.
+            await cancel_locator.dispatch_event("click", timeout=2000)
+            await random_delay()
+            log.info("Order cancelled using force.")
             cancellation_failures = 0  # Reset on success
         except Exception as e2:
-            print("Force cancellation failed:", e2)
+            log.info("Force cancellation failed: %s", e2)
             cancellation_failures += 1
 
-    # Check if the order still exists
-    active_order = safe_query_selector(page, ORDER_SELECTOR)
-    if active_order:
-        print("Cancellation did not remove the active order. Reloading page.")
-        page.reload()
+    # Confirm the order is gone; the detached wait doubles as the recheck.
+    try:
+        await LOCATORS["order"].wait_for(state="detached", timeout=2000)
+        return
+    except Exception:
+        pass
+
+    # A reload re-runs init scripts and renegotiates websockets (3-10s).
+    # Before paying that, yield two animation frames so the UI can settle
+    # and retry one force dispatch; reload only if the order survives that.
+    try:
+        await page.evaluate(RAF_YIELD_JS)
+        await cancel_locator.dispatch_event("click", timeout=2000)
+        await LOCATORS["order"].wait_for(state="detached", timeout=3000)
+        log.info("Order cancelled on retry.")
+        cancellation_failures = 0
+    except Exception:
+        log.info("Cancellation did not remove the active order. Reloading page.")
+        await page.reload()
         cancellation_failures = 0
 
-def safe_query_selector(page, selector):
-    """Query for an element while catching errors due to navigation/context destruction."""
+async def order_present(page):
+    """
+    Boolean check for the active order. Returns plain truth from one
+    evaluate instead of materializing an ElementHandle on both sides of
+    the protocol; errors from navigation/context destruction count as
+    "no order".
+    """
     try:
-        return page.query_selector(selector)
+        return await page.evaluate(ORDER_PRESENT_JS, ORDER_SELECTOR)
     except PlaywrightError as e:
-        print(f"Error querying selector {selector}: {e}")
-        return None
+        log.info("Error checking for active order: %s", e)
+        return False
 
 # --- Price Fetching Functions ---
-def get_real_buy_price(page):
+async def get_real_buy_price(page):
     """
-    Fetch the real BUY price from the button with classes:
-    "div.text-green-900 button, button.text-green-900"
+    Return the latest BUY price pushed by the in-page feed, falling back
+    to a direct DOM read if the feed has not reported yet.
     """
+    price = LATEST_PRICES.get("buy")
+    if price:
+        log.info("Fetched real BUY price: %s", price)
+        return price
     try:
-        buy_selector = "div.text-green-900 button, button.text-green-900"
-        buy_element = page.wait_for_selector(buy_selector, timeout=5000)
-        price = (buy_element.text_content() or "").strip()
-        print(f"Fetched real BUY price: {price}")
+        # The window mirror costs one tiny evaluate with no selector work;
+        # only if the feed never attached do we pay for a locator read.
+        price = await page.evaluate(LAST_PRICE_JS, "buy")
+        if not price:
+            price = (await page.locator(BUY_PRICE_SELECTOR).first.text_content(timeout=5000) or "").strip()
+        log.info("Fetched real BUY price: %s", price)
         return price
     except Exception as e:
-        print("Error fetching real BUY price:", e)
+        log.info("Error fetching real BUY price: %s", e)
         return None
 
-def compute_target_sell_price(page):
+async def compute_target_sell_price(page, current_price=None):
     """
     Compute the target SELL price by taking the current price
     and adding a random increment between 0.01 and 0.04.
+    If current_price is not given, it is fetched from the page.
     """
-    sell_selector = "div.text-red-900 button, button.text-red-900"
-    sell_element = page.wait_for_selector(sell_selector, timeout=5000)
-    current_price = (sell_element.text_content() or "").strip()
+    if current_price is None:
+        current_price = LATEST_PRICES.get("sell")
+    if current_price is None:
+        current_price = await page.evaluate(LAST_PRICE_JS, "sell")
+    if not current_price:
+        current_price = (await page.locator(SELL_PRICE_SELECTOR).first.text_content(timeout=5000) or "").strip()
     if not current_price:
-        print("Could not fetch current price for computing SELL price.")
+        log.info("Could not fetch current price for computing SELL price.")
         return None
     try:
         price_val = float(current_price)
     except Exception as e:
-        print("Error converting price to float:", e)
+        log.info("Error converting price to float: %s", e)
         return None
     increment = random.uniform(0.01, 0.04)
     target_sell_val = round(price_val + increment, 2)
     target_sell_price = f"{target_sell_val:.2f}"
-    print(f"Computed SELL price: {target_sell_price} (Current price: {current_price} + increment: {increment:.2f})")
+    log.info("Computed SELL price: %s (Current price: %s + increment: %.2f)", target_sell_price, current_price, increment)
     return target_sell_price
 
+async def fill_order_form(page, price_selector, price_value, amount_selector, amount_value,
+                          live_price_selector, price_side=None):
+    """
+    Set the limit-price and amount inputs through the native value setter
+    (so React sees a genuine input event) and read the live price back,
+    all in one evaluate. When price_side is given ("buy"), the freshest
+    in-page price from window.__lastPrices wins over price_value, so the
+    value committed to the form cannot be staler than the last observer
+    tick. Returns (used_price, live_price) or None on error.
+    """
+    try:
+        return await page.evaluate(
+            FILL_ORDER_FORM_JS,
+            [price_selector, price_value, amount_selector, amount_value, live_price_selector, price_side],
+        )
+    except Exception as e:
+        log.info("Error filling order form: %s", e)
+        return None
+
+async def wait_for_order_or_price_change(page, price_selector, baseline_price,
+                                          timeout=15000, price_side=None):
+    """
+    Wait in-browser until the active order disappears or the displayed
+    price moves away from baseline_price. Returns True if either event
+    happened within the timeout, False otherwise. The condition runs
+    inside the page, so Python never sleep-and-polls; when price_side is
+    given it compares against the MutationObserver quote mirror instead
+    of querying the DOM on every poll. Only a timeout maps to False —
+    anything else (context destroyed, crashed page) propagates so a
+    caller retrying on False cannot busy-loop on a broken page.
+    """
+    try:
+        await page.wait_for_function(
+            ORDER_OR_PRICE_CHANGE_JS,
+            arg=[ORDER_SELECTOR, price_selector, baseline_price, price_side],
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
 # --- Trade Functions ---
-def trade_limit_buy_asset(page):
+async def trade_limit_buy_asset(page):
     """
     Place a limit BUY order using the real BUY price.
     BEFORE entering the order, click the BUY tab.
-    After submission, perform up to 3 checks (with shorter intervals).
-    If the fetched real price differs from the order price at any check,
-    cancel the order and return False; otherwise, leave the order active.
+    After submission, wait for the order to fill or the price to drift.
+    If the price drifts away from the order price, cancel the order and
+    return False; otherwise, leave the order active.
     Finally, click the BUY tab.
     """
-    print(f"=== Initiating Limit BUY Order for {TRADE_ASSET} ===")
-    click_element(page, '[data-testid="trade-orderform-buy-tab"]')
-    click_element(page, '[data-testid="trade-orderform-limit-tab"]')
-
-    real_price = get_real_buy_price(page)
+    log.info("=== Initiating Limit BUY Order for %s ===", TRADE_ASSET)
+    # The two tab activations touch different buttons; overlap the round-trips.
+    await asyncio.gather(ensure_tab(page, "buy_tab"), ensure_tab(page, "limit_tab"))
+
+    # Price and balance reads are independent round-trips; overlap them.
+    real_price, balances = await asyncio.gather(
+        get_real_buy_price(page), get_balances_cached(page)
+    )
     if not real_price:
-        print("Could not fetch real BUY price; aborting order.")
+        log.info("Could not fetch real BUY price; aborting order.")
         return False
     last_order_price = real_price
-    print(f"Using real BUY price: {last_order_price}")
+    log.info("Using real BUY price: %s", last_order_price)
 
-    limit_price_input_selector = '[data-testid="trade-orderform-limit-price-input"]'
-    page.wait_for_selector(limit_price_input_selector)
-    move_mouse_to_element(page, limit_price_input_selector)
-    random_delay()
-    page.fill(limit_price_input_selector, last_order_price)
-    random_delay()
-
-    asset_balance, usdt_balance = get_balances(page)
-    print(f"Current balances - {TRADE_ASSET}: {asset_balance}, USDT: {usdt_balance}")
+    asset_balance, usdt_balance = balances
+    log.info("Current balances - %s: %s, USDT: %s", TRADE_ASSET, asset_balance, usdt_balance)
 
     random_percent = random.uniform(0.80, 0.95)
     deduction = random.uniform(1, 2)
     available_for_trade = usdt_balance - deduction
     if available_for_trade <= 0:
-        print("Not enough USDT after deduction.")
+        log.info("Not enough USDT after deduction.")
         return False
     trade_amount = round(available_for_trade * random_percent, 3)
-    print(f"Using {trade_amount} USDT for BUY order (percent: {random_percent:.2f}, deduction: {deduction:.2f}).")
-
-    notional_input_selector = '[data-testid="trade-orderform-notional-input"]'
-    page.wait_for_selector(notional_input_selector)
-    move_mouse_to_element(page, notional_input_selector)
-    random_delay()
-    page.fill(notional_input_selector, str(trade_amount))
-    random_delay()
-
-    # Re-read real price before submission
-    new_price = get_real_buy_price(page)
-    if new_price and new_price != last_order_price:
-        print(f"Real BUY price changed from {last_order_price} to {new_price} before submission. Updating.")
-        page.fill(limit_price_input_selector, new_price)
-        last_order_price = new_price
-        random_delay()
-
-    click_element(page, '[data-testid="trade-orderform-submit-button"]')
-
-    # Perform up to 3 checks with a shorter interval
-    check_count = 0
-    while check_count < 3:
-        time.sleep(3 * SPEED_FACTOR)
-        order_present = safe_query_selector(page, ORDER_SELECTOR)
-        if not order_present:
-            print("BUY order filled; no active order found.")
-            click_element(page, '[data-testid="trade-orderform-buy-tab"]')
-            return True
-        current_real_price = get_real_buy_price(page)
-        if current_real_price != last_order_price:
-            print(f"Check {check_count+1}: Price changed from {last_order_price} to {current_real_price}. Cancelling BUY order.")
-            cancel_order(page)
-            click_element(page, '[data-testid="trade-orderform-buy-tab"]')
-            return False
-        else:
-            print(f"Check {check_count+1}: Real BUY price unchanged at {current_real_price}.")
-        check_count += 1
+    log.info("Using %s USDT for BUY order (percent: %.2f, deduction: %.2f).", trade_amount, random_percent, deduction)
+
+    limit_price_input = LOCATORS["limit_price_input"]
+    await move_mouse_to_element(page, limit_price_input)
+    await random_delay()
+    # Both inputs and the pre-submit price re-read happen in one round-trip;
+    # the freshest in-page BUY price is committed atomically.
+    filled = await fill_order_form(
+        page,
+        HOT_SELECTORS["limit_price_input"], last_order_price,
+        HOT_SELECTORS["notional_input"], str(trade_amount),
+        BUY_PRICE_SELECTOR, price_side="buy",
+    )
+    if filled is None:
+        # Submitting anyway would send whatever stale values the form still
+        # holds from the previous attempt.
+        log.info("Could not fill BUY order form; aborting order.")
+        return False
+    used_price, live_price = filled
+    if used_price and used_price != last_order_price:
+        log.info("Real BUY price refreshed from %s to %s at fill time.", last_order_price, used_price)
+        last_order_price = used_price
+    if live_price and live_price != last_order_price:
+        log.info("Real BUY price changed from %s to %s before submission. Updating.", last_order_price, live_price)
+        # The move_mouse_to_element auto-wait above already proved the input
+        # is attached; skip the actionability ceremony and fail fast.
+        await limit_price_input.fill(live_price, timeout=2000, force=True)
+        last_order_price = live_price
+
+    await click_element(page, LOCATORS["submit_button"])
+
+    # Wait for either the order to fill or the BUY price to move away
+    # from the order price, instead of sleep-and-poll checks.
+    if not await wait_for_order_or_price_change(
+            page, BUY_PRICE_SELECTOR, last_order_price,
+            timeout=int(9000 * SPEED_FACTOR), price_side="buy"):
+        log.info("Active BUY order still exists at an unchanged price. Cancelling and recreating order.")
+        await cancel_order(page)
+        await ensure_tab(page, "buy_tab")
+        return False
 
-    print("After 3 checks, active BUY order still exists. Cancelling and recreating order.")
-    cancel_order(page)
-    click_element(page, '[data-testid="trade-orderform-buy-tab"]')
+    # The order check and the price read are independent; overlap them.
+    active, current_real_price = await asyncio.gather(
+        order_present(page), get_real_buy_price(page)
+    )
+    if not active:
+        log.info("BUY order filled; no active order found.")
+        _balances_cache["val"] = None
+        await ensure_tab(page, "buy_tab")
+        return True
+
+    log.info("Price changed from %s to %s. Cancelling BUY order.", last_order_price, current_real_price)
+    await cancel_order(page)
+    await ensure_tab(page, "buy_tab")
     return False
 
-def trade_limit_sell_asset(page):
+async def trade_limit_sell_asset(page):
     """
     Place a limit SELL order by computing the target as (current price + random increment).
     BEFORE entering the order, click the SELL tab.
-    After submission, perform up to 3 checks (with longer delays).
-    In each check, recompute the target SELL price using the current price.
-    If it differs from the order price placed, cancel the order and return False;
+    After submission, wait for the order to fill or the price to drift.
+    If the price drifts, cancel the order and return False;
     however, if cancellation fails because the cancel button is hidden,
     wait a bit and check: if no active order is present, assume the order executed successfully.
     Finally, click the SELL tab.
     """
-    print(f"=== Initiating Limit SELL Order for {TRADE_ASSET} ===")
-    click_element(page, '[data-testid="trade-orderform-sell-tab"]')
-    click_element(page, '[data-testid="trade-orderform-limit-tab"]')
-    click_element(page, '[data-testid="trade-orderform-sell-tab"]')  # Ensure sell form is active
-
-    target_sell_price = compute_target_sell_price(page)
+    log.info("=== Initiating Limit SELL Order for %s ===", TRADE_ASSET)
+    # The two tab activations touch different buttons; overlap the round-trips.
+    await asyncio.gather(ensure_tab(page, "sell_tab"), ensure_tab(page, "limit_tab"))
+
+    # Price and balance reads are independent round-trips; overlap them.
+    target_sell_price, balances = await asyncio.gather(
+        compute_target_sell_price(page), get_balances_cached(page)
+    )
     if not target_sell_price:
-        print("Could not compute target SELL price; aborting order.")
+        log.info("Could not compute target SELL price; aborting order.")
         return False
     last_order_price = target_sell_price
-    print(f"Using target SELL price: {last_order_price}")
+    log.info("Using target SELL price: %s", last_order_price)
 
-    limit_price_input_selector = '[data-testid="trade-orderform-limit-price-input"]'
-    page.wait_for_selector(limit_price_input_selector)
-    move_mouse_to_element(page, limit_price_input_selector)
-    random_delay()
-    page.fill(limit_price_input_selector, last_order_price)
-    random_delay()
-
-    asset_balance, usdt_balance = get_balances(page)
-    print(f"Current balances - {TRADE_ASSET}: {asset_balance}, USDT: {usdt_balance}")
+    asset_balance, usdt_balance = balances
+    log.info("Current balances - %s: %s, USDT: %s", TRADE_ASSET, asset_balance, usdt_balance)
 
     random_percent = random.uniform(0.80, 0.95)
     trade_amount = round(asset_balance * random_percent, 3)
-    print(f"Selling {trade_amount} {TRADE_ASSET} for SELL order (percent: {random_percent:.2f}).")
-
-    size_input_selector = '[data-testid="trade-orderform-size-input"]'
-    page.wait_for_selector(size_input_selector)
-    move_mouse_to_element(page, size_input_selector)
-    random_delay()
-    page.fill(size_input_selector, str(trade_amount))
-    random_delay()
-
-    # Recompute target SELL price before submission
-    new_target = compute_target_sell_price(page)
+    log.info("Selling %s %s for SELL order (percent: %.2f).", trade_amount, TRADE_ASSET, random_percent)
+
+    limit_price_input = LOCATORS["limit_price_input"]
+    await move_mouse_to_element(page, limit_price_input)
+    await random_delay()
+    # Both inputs and the pre-submit price re-read happen in one round-trip.
+    # The SELL order price is a computed target, so no price_side override.
+    filled = await fill_order_form(
+        page,
+        HOT_SELECTORS["limit_price_input"], last_order_price,
+        HOT_SELECTORS["size_input"], str(trade_amount),
+        SELL_PRICE_SELECTOR,
+    )
+    if filled is None:
+        # Submitting anyway would send whatever stale values the form still
+        # holds from the previous attempt.
+        log.info("Could not fill SELL order form; aborting order.")
+        return False
+    live_price = filled[1]
+    new_target = await compute_target_sell_price(page, live_price) if live_price else None
     if new_target and new_target != last_order_price:
-        print(f"Computed target SELL price changed from {last_order_price} to {new_target} before submission. Updating.")
-        page.fill(limit_price_input_selector, new_target)
+        log.info("Computed target SELL price changed from %s to %s before submission. Updating.", last_order_price, new_target)
+        # The move_mouse_to_element auto-wait above already proved the input
+        # is attached; skip the actionability ceremony and fail fast.
+        await limit_price_input.fill(new_target, timeout=2000, force=True)
         last_order_price = new_target
-        random_delay()
-
-    click_element(page, '[data-testid="trade-orderform-submit-button"]')
-
-    # Perform up to 3 checks with a longer interval (5-8 seconds)
-    check_count = 0
-    while check_count < 3:
-        delay = random.uniform(5, 8) * SPEED_FACTOR
-        time.sleep(delay)
-        order_present = safe_query_selector(page, ORDER_SELECTOR)
-        if not order_present:
-            print("SELL order filled; no active order found.")
-            click_element(page, '[data-testid="trade-orderform-sell-tab"]')
-            return True
-        new_target = compute_target_sell_price(page)
-        if new_target != last_order_price:
-            print(f"Check {check_count+1}: Computed target SELL price changed from {last_order_price} to {new_target}. Cancelling SELL order.")
-            cancel_order(page)
-            # Wait a bit after attempting cancellation
-            time.sleep(random.uniform(2, 3) * SPEED_FACTOR)
-            active_order_after = safe_query_selector(page, ORDER_SELECTOR)
-            if not active_order_after:
-                print("Order appears to have executed successfully despite cancellation errors.")
-                click_element(page, '[data-testid="trade-orderform-sell-tab"]')
-                return True
-            else:
-                click_element(page, '[data-testid="trade-orderform-sell-tab"]')
-                return False
-        else:
-            print(f"Check {check_count+1}: Computed target SELL price unchanged at {new_target}.")
-        check_count += 1
 
-    print("After 3 checks, active SELL order still exists. Cancelling and recreating order.")
-    cancel_order(page)
-    click_element(page, '[data-testid="trade-orderform-sell-tab"]')
+    await click_element(page, LOCATORS["submit_button"])
+
+    # Wait in-browser for either the order to disappear or the SELL price
+    # to move away from the price the target was computed from. The whole
+    # post-submit window shares one monotonic deadline, so a transient
+    # evaluation error only burns the time already spent, not a fresh
+    # fixed-length sleep.
+    baseline_price = live_price or None
+    deadline = time.monotonic() + 24 * SPEED_FACTOR
+    resolved = False
+    while time.monotonic() < deadline:
+        remaining_ms = max(int((deadline - time.monotonic()) * 1000), 1)
+        if await wait_for_order_or_price_change(
+                page, SELL_PRICE_SELECTOR, baseline_price,
+                timeout=remaining_ms, price_side="sell"):
+            resolved = True
+            break
+        # A timeout exhausts the remaining budget and exits the loop;
+        # other failures raise out to main()'s crash-recovery restart.
+
+    if not resolved:
+        log.info("Active SELL order still exists at an unchanged price. Cancelling and recreating order.")
+        await cancel_order(page)
+        await ensure_tab(page, "sell_tab")
+        return False
+
+    if not await order_present(page):
+        log.info("SELL order filled; no active order found.")
+        _balances_cache["val"] = None
+        await ensure_tab(page, "sell_tab")
+        return True
+
+    log.info("SELL price moved away from %s. Cancelling SELL order.", baseline_price)
+    await cancel_order(page)
+    # Wait a bit after attempting cancellation
+    await asyncio.sleep(random.uniform(2, 3) * SPEED_FACTOR)
+    if not await order_present(page):
+        log.info("Order appears to have executed successfully despite cancellation errors.")
+        _balances_cache["val"] = None
+        await ensure_tab(page, "sell_tab")
+        return True
+    await ensure_tab(page, "sell_tab")
     return False
 
+# Parsed-file caches keyed by mtime; main()'s crash-recovery loop calls
+# load_cookies/load_proxy on every restart, and the files rarely change.
+_cookie_cache = {"mtime": None, "val": None}
+_proxy_cache = {"mtime": None, "val": None}
+
 def load_cookies():
     """
-    Read cookies from COOKIE_FILE.
-    If the file contains a semicolon-separated string, split it accordingly;
-    otherwise, expect one cookie per line in the format name=value.
+    Read cookies from COOKIE_FILE. The file is either the JSON list
+    written by save_cookies_to_file (full cookie fields preserved) or the
+    legacy name=value format: one cookie per line, or a single
+    semicolon-separated string.
+    The parsed list is cached and only re-read when the file changes.
     """
-    cookies = []
-    if not os.path.exists(COOKIE_FILE):
-        print(f"{COOKIE_FILE} not found. No cookies loaded.")
-        return cookies
+    try:
+        mtime = os.stat(COOKIE_FILE).st_mtime
+    except OSError:
+        log.info("%s not found. No cookies loaded.", COOKIE_FILE)
+        return []
+    if mtime == _cookie_cache["mtime"]:
+        return _cookie_cache["val"]
 
     with open(COOKIE_FILE, "r") as f:
         content = f.read().strip()
-        if not content:
-            return cookies
 
+    cookies = []
+    if content.startswith("["):
+        try:
+            cookies = json.loads(content)
+        except ValueError as e:
+            log.info("Error parsing %s as JSON: %s", COOKIE_FILE, e)
+    elif content:
         # If the content contains semicolons, assume it's a single cookie string.
         if ";" in content:
             parts = content.split(";")
         else:
             parts = content.splitlines()
 
-        for part in parts:
-            part = part.strip()
-            if "=" in part:
-                name, value = part.split("=", 1)
-                cookies.append({
-                    "name": name.strip(),
-                    "value": value.strip(),
-                    "domain": "arkm.com",
-                    "path": "/"
-                })
+        cookies = [
+            {"name": name.strip(), "value": value.strip(), "domain": "arkm.com", "path": "/"}
+            for name, value in (part.split("=", 1) for part in parts if "=" in part)
+        ]
+    _cookie_cache.update(mtime=mtime, val=cookies)
     return cookies
 
 def load_proxy():
-    """Read the proxy URL from PROXY_FILE and parse it. Returns None if file not found or empty."""
-    if not os.path.exists(PROXY_FILE):
-        print(f"{PROXY_FILE} not found. No proxy will be used.")
+    """
+    Read the proxy URL from PROXY_FILE and parse it. Returns None if file
+    not found or empty. The parsed config is cached and only re-read when
+    the file changes.
+    """
+    try:
+        mtime = os.stat(PROXY_FILE).st_mtime
+    except OSError:
+        log.info("%s not found. No proxy will be used.", PROXY_FILE)
         return None
+    if mtime == _proxy_cache["mtime"]:
+        return _proxy_cache["val"]
+
+    proxy_config = None
     with open(PROXY_FILE, "r") as f:
         proxy_line = f.read().strip()
-        if not proxy_line:
-            return None
-        parsed = urlparse(proxy_line)
-        proxy_config = {
-            "server": f"{parsed.scheme}://{parsed.hostname}:{parsed.port}",
-            "username": parsed.username,
-            "password": parsed.password
-        }
-        return proxy_config
-
-def save_cookies_to_file(context):
-    cookies = context.cookies()
-    with open(COOKIE_FILE, "w") as f:
-        for cookie in cookies:
-            f.write(f"{cookie['name']}={cookie['value']}\n")
-    print("Cookies saved to", COOKIE_FILE)
-
-def run_trading_loop():
+        if proxy_line:
+            parsed = urlparse(proxy_line)
+            proxy_config = {
+                "server": f"{parsed.scheme}://{parsed.hostname}:{parsed.port}",
+                "username": parsed.username,
+                "password": parsed.password
+            }
+    _proxy_cache.update(mtime=mtime, val=proxy_config)
+    return proxy_config
+
+async def save_cookies_to_file(context):
+    """
+    Persist cookies as JSON via write-to-temp + atomic rename, so a crash
+    mid-write cannot corrupt the file and all cookie fields
+    (domain/expires/httpOnly) survive a restart.
+    """
+    cookies = await context.cookies()
+    tmp_file = COOKIE_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(cookies, f)
+    os.replace(tmp_file, COOKIE_FILE)
+    log.info("Cookies saved to %s", COOKIE_FILE)
+
+async def block_nonessential_requests(route):
+    """
+    Abort requests the bot never consumes (images, fonts, media and
+    third-party trackers) while leaving XHR/websockets for the price
+    feed untouched. Cuts bytes loaded and page-load time, especially
+    through a proxy.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+            fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def run_trading_loop():
     """Launches the browser, navigates to the trading page, and runs the trade loop."""
     proxy_config = load_proxy()  # This returns None if no proxy is set.
-    with sync_playwright() as p:
+    async with async_playwright() as p:
         user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/105.0.0.0 Safari/537.36"
         )
-        print("Using user agent:", user_agent)
+        log.info("Using user agent: %s", user_agent)
         launch_args = {"headless": True}
         if proxy_config:
             launch_args["proxy"] = proxy_config
-            print("Using proxy:", proxy_config)
-        browser = p.chromium.launch(**launch_args)
+            log.info("Using proxy: %s", proxy_config)
+        # A persistent profile keeps cookies, IndexedDB and the rest of the
+        # fingerprint across crashes, so warm restarts skip the cold login
+        # path entirely.
+        warm_start = os.path.isdir(PROFILE_DIR)
         # ignore HTTPS errors to help bypass potential issues via proxy
-        context = browser.new_context(user_agent=user_agent, ignore_https_errors=True)
-        context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', { get: () => false });
-            Object.defineProperty(navigator, 'platform', { get: () => 'Win32' });
-            Object.defineProperty(navigator, 'appVersion', { get: () => '5.0 (Windows NT 10.0; Win64; x64)' });
-            window.chrome = { runtime: {} };
-            Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
-            Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
-            sessionStorage.setItem('metamaskConfig', JSON.stringify({
-                hideProvidersArray: false,
-                showMetamaskExplainer: false,
-                dontOverrideWindowEthereum: false
-            }));
-            const dbName = "WALLET_CONNECT_V2_INDEXED_DB";
-            const storeName = "keyvaluepairs";
-            const key = "wc@2:core:0.3:keychain";
-            const value = JSON.stringify({});
-            const openRequest = indexedDB.open(dbName);
-            openRequest.onupgradeneeded = (e) => {
-                const db = e.target.result;
-                if (!db.objectStoreNames.contains(storeName)) {
-                    db.createObjectStore(storeName);
-                }
-            };
-            openRequest.onerror = (e) => { console.error(e.target.error); };
-            openRequest.onsuccess = (e) => {
-                const db = e.target.result;
-                const tx = db.transaction(storeName, "readwrite");
-                const store = tx.objectStore(storeName);
-                store.put(value, key);
-                tx.oncomplete = () => { db.close(); };
-            };
-        """)
-        # Load cookies from file and add them to the context
-        cookies = load_cookies()
-        if cookies:
-            context.add_cookies(cookies)
-            print("Cookies loaded from file.")
-
-        # Use TRADE_ASSET in the URL
-        page = context.new_page()
+        context = await p.chromium.launch_persistent_context(
+            PROFILE_DIR, user_agent=user_agent, ignore_https_errors=True, **launch_args)
+        # Push-based price feed: the page reports price changes to Python,
+        # so the trade loop reads local memory instead of querying the DOM.
+        LATEST_PRICES.clear()
+        # An order active at crash time can fill during the restart window,
+        # so balances cached by the previous browser are no longer trusted.
+        _balances_cache["val"] = None
+        await context.expose_binding("onPrice", record_price)
+        await context.add_init_script(PRICE_FEED_JS)
+        await context.add_init_script(STEALTH_INIT_JS)
+        await context.add_init_script(WALLET_DB_INIT_JS)
+        await context.route("**/*", block_nonessential_requests)
+        # Seed cookies from file only on the first (cold) start; warm
+        # starts already have them in the profile.
+        if not warm_start:
+            cookies = load_cookies()
+            if cookies:
+                await context.add_cookies(cookies)
+                log.info("Cookies loaded from file.")
+
+        # Use TRADE_ASSET in the URL; the persistent context opens with a
+        # blank page we can reuse.
+        page = context.pages[0] if context.pages else await context.new_page()
+        build_locators(page)
         trade_pair = f"{TRADE_ASSET}_USDT"
         url = f"https://arkm.com/trade/{trade_pair}"
         try:
-            page.goto(url, wait_until="networkidle", timeout=60000)
+            # The live price feed keeps the network busy, so "networkidle"
+            # never fires quickly; wait only for the DOM and then gate on
+            # the wallet panel, the first thing the trade loop reads.
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            await page.wait_for_selector(WALLET_READY_SELECTOR, timeout=30000)
         except Exception as e:
-            print(f"Error navigating to {url}: {e}")
+            log.info("Error navigating to %s: %s", url, e)
             try:
-                browser.close()
+                await context.close()
             except Exception as close_e:
-                print("Error closing browser:", close_e)
+                log.info("Error closing browser: %s", close_e)
             return
-        page.wait_for_load_state("networkidle")
-        time.sleep(3)
-        save_cookies_to_file(context)
+        if not warm_start:
+            await save_cookies_to_file(context)
 
-        print("Starting trade loop. Press Ctrl+C to stop.")
+        log.info("Starting trade loop. Press Ctrl+C to stop.")
         transaction_type = 'buy'
-        active_order_count = 0
         while True:
             try:
-                active_order = safe_query_selector(page, ORDER_SELECTOR)
+                active_order = await order_present(page)
             except Exception as e:
-                print("Error checking active order:", e)
+                log.info("Error checking active order: %s", e)
                 active_order = None
 
             if active_order:
-                active_order_count += 1
-                print(f"Active order exists. Count: {active_order_count}. Waiting for resolution before starting a new trade.")
-                if active_order_count >= 3:
-                    print("Active order detected 3 times consecutively. Cancelling active order.")
-                    cancel_order(page)
-                    active_order_count = 0
-                time.sleep(10 * SPEED_FACTOR)
+                log.info("Active order exists. Waiting for it to resolve before starting a new trade.")
+                try:
+                    # The browser notifies us the moment the order node is
+                    # removed, instead of sleeping in fixed 10s increments.
+                    await LOCATORS["order"].wait_for(
+                        state="detached", timeout=int(30000 * SPEED_FACTOR)
+                    )
+                except Exception:
+                    log.info("Active order did not resolve in time. Cancelling active order.")
+                    await cancel_order(page)
+                # Either way the order may just have filled, which moves
+                # balances; the next trade must re-read them.
+                _balances_cache["val"] = None
                 continue
-            else:
-                active_order_count = 0
 
             if transaction_type == 'buy':
-                print("\nAttempting LIMIT BUY order...")
-                success = trade_limit_buy_asset(page)
+                log.info("\nAttempting LIMIT BUY order...")
+                success = await trade_limit_buy_asset(page)
                 if success:
-                    if not safe_query_selector(page, ORDER_SELECTOR):
+                    if not await order_present(page):
                         transaction_type = 'sell'
                 else:
-                    print("BUY order not executed. Retrying BUY order...")
+                    log.info("BUY order not executed. Retrying BUY order...")
             else:
-                print("\nAttempting LIMIT SELL order...")
-                success = trade_limit_sell_asset(page)
+                log.info("\nAttempting LIMIT SELL order...")
+                success = await trade_limit_sell_asset(page)
                 if success:
-                    if not safe_query_selector(page, ORDER_SELECTOR):
+                    if not await order_present(page):
                         transaction_type = 'buy'
                 else:
-                    print("SELL order not executed. Retrying SELL order...")
+                    log.info("SELL order not executed. Retrying SELL order...")
             # Minimal delay between transactions to reduce slippage
-            random_delay(0.1, 0.3)
+            await random_delay(0.1, 0.3)
     try:
-        browser.close()
+        await context.close()
     except Exception as close_err:
-        print("Error closing browser:", close_err)
+        log.info("Error closing browser: %s", close_err)
 
-def main():
+async def main():
     while True:
         try:
-            run_trading_loop()
-        except KeyboardInterrupt:
-            print("Exiting trade loop...")
+            await run_trading_loop()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Under asyncio.run, Ctrl+C reaches the main task as
+            # CancelledError rather than KeyboardInterrupt.
+            log.info("Exiting trade loop...")
             break
         except Exception as e:
-            print("Exception occurred in trading loop:", e)
-            print("Restarting browser and trading loop in 5 seconds...")
-            time.sleep(5)
+            log.info("Exception occurred in trading loop: %s", e)
+            log.info("Restarting browser and trading loop in 5 seconds...")
+            await asyncio.sleep(5)
 
 if __name__ == "__main__":
-    main()
+    listener = setup_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()